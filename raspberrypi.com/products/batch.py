@@ -1,8 +1,20 @@
-import json
+import orjson
 import os.path
-from jsonschema import validate
+import fastjsonschema
 import argparse
-import subprocess
+from operator import itemgetter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from playwright.sync_api import sync_playwright
+from crawl import (
+    DOWNLOADS_CACHE_FILENAME,
+    connect_browser,
+    new_browser_context,
+    crawl_topic,
+    load_downloads_cache,
+    save_downloads_cache,
+)
+
+CRAWL_CONCURRENCY = int(os.getenv("CRAWL_CONCURRENCY", "4"))
 
 STRUCTURE_SCHEMA = {
     "$schema": "http://json-schema.org/draft-07/schema#",
@@ -43,6 +55,62 @@ STRUCTURE_SCHEMA = {
     },
 }
 
+# Compiled once into a plain Python function instead of re-interpreting the schema.
+validate_structure = fastjsonschema.compile(STRUCTURE_SCHEMA)
+
+def get_all_topics(data):
+    # Iterative pre-order walk; pushing children reversed keeps the original order.
+    topics = []
+    stack = list(reversed(data))
+    while stack:
+        topic = stack.pop()
+        topics.append(
+            {
+                "url": topic["url"],
+                "path": "/".join(t.replace("/", "_slash_") for t in topic["breadcrumbs"]),
+            }
+        )
+        stack.extend(reversed(topic["sub_topics"]))
+    topics.sort(key=itemgetter("path"))
+    return topics
+
+def close_context(context):
+    try:
+        context.close()
+    except Exception as e:
+        print(f"Ignoring error while closing browser context: {e}")
+
+def crawl_topics(topics, output_dir):
+    failed = []
+    with sync_playwright() as p:
+        browser = connect_browser(p)
+        context = new_browser_context(p, browser)
+        try:
+            for topic in topics:
+                print(f"Processing topic {topic['path']}")
+                # One retry, only when the failure came from a dropped session
+                # (e.g. browserless time limit); other failures are recorded.
+                for attempt in range(2):
+                    if not browser.is_connected():
+                        print("Browser connection lost, reconnecting")
+                        close_context(context)
+                        browser = connect_browser(p)
+                        context = new_browser_context(p, browser)
+                    try:
+                        crawl_topic(topic["url"], os.path.join(output_dir, topic["path"]), context)
+                        break
+                    except Exception as e:
+                        if attempt == 0 and not browser.is_connected():
+                            continue
+                        print(f"Failed topic {topic['path']}: {e}")
+                        failed.append(topic["path"])
+                        break
+        finally:
+            close_context(context)
+
+    if failed:
+        raise RuntimeError(f"{len(failed)} topic(s) failed: {', '.join(failed)}")
+
 def main():
     parser = argparse.ArgumentParser()
     parser.add_argument("--structure_file", type=str, required=True)
@@ -52,25 +120,15 @@ def main():
     parser.add_argument("--output_dir", type=str, required=True)
     args = parser.parse_args()
 
-    with open(args.structure_file, "r") as f:
-        data = json.load(f)
+    with open(args.structure_file, "rb") as f:
+        data = orjson.loads(f.read())
 
-    validate(instance=data, schema=STRUCTURE_SCHEMA)
+    try:
+        validate_structure(data)
+    except fastjsonschema.JsonSchemaException as e:
+        raise SystemExit(f"Invalid structure file {args.structure_file}: {e.message}")
 
-    def get_all_topics(topic):
-        return [
-            {
-                "url": topic["url"],
-                "path": "/".join([t.replace("/", "_slash_") for t in topic["breadcrumbs"]]),
-            }
-        ] + [
-            descendant
-            for sub_topic in topic["sub_topics"]
-            for descendant in get_all_topics(sub_topic)
-        ]
-
-    topics = [descendant for topic in data for descendant in get_all_topics(topic)]
-    topics = sorted(topics, key=lambda x: x["path"])
+    topics = get_all_topics(data)
 
     if args.topic_range != "*":
         start, end = map(int, args.topic_range.split("-"))
@@ -83,19 +141,19 @@ def main():
         args.group_index * batch_size : (args.group_index + 1) * batch_size
     ]
 
-    for topic in current_group:
-        print(f"Processing topic {topic['path']}")
-        subprocess.run(
-            [
-                "python",
-                "/app/crawl.py",
-                "--url",
-                topic["url"],
-                "--out",
-                os.path.join(args.output_dir, topic["path"]),
-            ],
-            check=True,
-        )
+    # Each worker keeps one CDP connection and context open for its whole
+    # share of topics, so the worker count is also the cap on concurrent tabs.
+    # Keep CRAWL_CONCURRENCY within the browserless session quota.
+    workers = max(1, min(CRAWL_CONCURRENCY, len(current_group)))
+    chunks = [current_group[i::workers] for i in range(workers)]
+    load_downloads_cache(os.path.join(args.output_dir, DOWNLOADS_CACHE_FILENAME))
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(crawl_topics, chunk, args.output_dir) for chunk in chunks]
+            for future in as_completed(futures):
+                future.result()
+    finally:
+        save_downloads_cache()
 
 if __name__ == "__main__":
     main()
@@ -1,26 +1,42 @@
 import os
-import json
-import requests
+import time
+import orjson
+import httpx
 import logging
 import mimetypes
+import shutil
 import argparse
+import threading
+import uuid
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
 from urllib.parse import urljoin, urlparse
-from playwright.sync_api import sync_playwright
+from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeoutError
 from datetime import datetime
 from markdownify import markdownify as md
-from bs4 import BeautifulSoup
+import lxml.html
+from lxml import etree
+from lxml.cssselect import CSSSelector
 
 
 # ---------------- Logging Setup ---------------- #
 logging.basicConfig(level=logging.INFO,
                     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
+logging.getLogger("httpx").setLevel(logging.WARNING)
 
 # ---------------- Config ---------------- #
 TOKEN = os.environ.get("BROWSERLESS_TOKEN")
 OXY_USER = os.getenv("OXYLAB_ISP_USERNAME")
 OXY_PASS = os.getenv("OXYLAB_ISP_PASSWORD")
 OXY_HOST = "isp.oxylabs.io:8007"
+BROWSERLESS_CDP_URL = os.getenv(
+    "BROWSERLESS_CDP_URL", f"wss://production-sfo.browserless.io?token={TOKEN}"
+)
+DOWNLOAD_CONCURRENCY = int(os.getenv("DOWNLOAD_CONCURRENCY", "8"))
+DOWNLOADS_CACHE_FILENAME = "downloads_cache.json"
 
 config = {
     "documentation_xpaths": ["a[href$='.pdf']"],
@@ -39,32 +55,207 @@ config = {
     ],
 }
 
-# ---------------- File Downloader ---------------- #
-def download_file(url, folder, file_type, use_this_name=None, file_date=None, version=None, description=None):
-    if not url.startswith("http"):
-        return None
-    headers = {
+# Each selector group is joined into one CSS selector list and compiled once
+# to an lxml XPath, so the DOM is walked once per group, in C, and matches
+# come back in document order.
+def compile_selector(selectors):
+    if isinstance(selectors, str):
+        selectors = [selectors]
+    return CSSSelector(", ".join(selectors), translator="html")
+
+OVERVIEW_SELECTOR = compile_selector(config["overview_text_xpath"])
+SPECIFICATIONS_SELECTOR = compile_selector(config["specifications_xpath"])
+DATASHEET_SELECTOR = compile_selector(config["product_datasheet_selector"])
+DOCUMENTATION_SELECTOR = compile_selector(config["documentation_xpaths"])
+IMAGE_SELECTOR = compile_selector(config["image_xpaths"])
+BLOCK_DIAGRAM_SELECTOR = compile_selector(config["block_diagram_xpath"])
+CATEGORY_HEADING_SELECTOR = compile_selector("section h2")
+# Same strings BeautifulSoup's get_text() yields: script/style bodies are skipped.
+TEXT_NODES = etree.XPath(".//text()[not(ancestor::script or ancestor::style)]")
+
+def outer_html(element):
+    return lxml.html.tostring(element, encoding="unicode", with_tail=False)
+
+def stripped_text(element):
+    return "".join(text.strip() for text in TEXT_NODES(element))
+
+# ---------------- HTTP Client ---------------- #
+# One shared HTTP/2 client: concurrent downloads from the same CDN are
+# multiplexed as streams over a single TLS connection (hosts without h2 fall
+# back to pooled HTTP/1.1 keep-alive). The transport retries failed connects;
+# retryable statuses are handled in request_with_retries().
+CLIENT = httpx.Client(
+    headers={
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
                       "AppleWebKit/537.36 (KHTML, like Gecko) "
                       "Chrome/116.0.0.0 Safari/537.36",
         "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
         "Accept-Language": "en-US,en;q=0.5",
         "Referer": "https://files.latticesemi.com/",
-    }
+    },
+    transport=httpx.HTTPTransport(
+        http2=True,
+        retries=3,
+        limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+    ),
+    timeout=120,
+    follow_redirects=True,
+)
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+MAX_RETRIES = 3
+RETRY_BACKOFF = 0.5
+
+def request_with_retries(method, url, timeout=120, stream=False, headers=None):
+    for attempt in range(MAX_RETRIES + 1):
+        request = CLIENT.build_request(method, url, timeout=timeout, headers=headers)
+        response = CLIENT.send(request, stream=stream)
+        if response.status_code not in RETRY_STATUSES or attempt == MAX_RETRIES:
+            return response
+        response.close()
+        time.sleep(RETRY_BACKOFF * 2 ** attempt)
+
+# ---------------- Download Cache ---------------- #
+# url -> {"etag", "last_modified", "file_path", "metadata"} persisted between
+# runs, so unchanged files are revalidated with a conditional GET (304, no
+# body) instead of being downloaded again. Disabled until a cache is loaded.
+_downloads_cache = None
+_downloads_cache_path = None
+_downloads_cache_lock = threading.Lock()
+
+def load_downloads_cache(path):
+    global _downloads_cache, _downloads_cache_path
+    _downloads_cache_path = path
     try:
-        response = requests.get(url, headers=headers, timeout=120, stream=True)
+        with open(path, "rb") as f:
+            _downloads_cache = orjson.loads(f.read())
+        logger.info(f"🗃️ Loaded {len(_downloads_cache)} cached downloads ← {path}")
+    except FileNotFoundError:
+        _downloads_cache = {}
+    except Exception as e:
+        logger.warning(f"⚠️ Ignoring unreadable download cache {path}: {e}")
+        _downloads_cache = {}
+
+def save_downloads_cache():
+    if _downloads_cache is None:
+        return
+    try:
+        with _downloads_cache_lock:
+            data = orjson.dumps(_downloads_cache, option=orjson.OPT_INDENT_2)
+        os.makedirs(os.path.dirname(_downloads_cache_path) or ".", exist_ok=True)
+        tmp_path = _downloads_cache_path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, _downloads_cache_path)
+        logger.info(f"🗃️ Saved download cache → {_downloads_cache_path}")
+    except Exception as e:
+        logger.error(f"💥 Failed to save download cache: {e}")
+
+def get_cached_download(url):
+    if _downloads_cache is None:
+        return None
+    with _downloads_cache_lock:
+        entry = _downloads_cache.get(url)
+    if entry and os.path.exists(entry["file_path"]):
+        return entry
+    return None
+
+def remember_download(url, response, metadata):
+    etag = response.headers.get("ETag")
+    last_modified = response.headers.get("Last-Modified")
+    if _downloads_cache is None or not (etag or last_modified):
+        return
+    with _downloads_cache_lock:
+        _downloads_cache[url] = {
+            "etag": etag,
+            "last_modified": last_modified,
+            "file_path": metadata["file_path"],
+            "metadata": metadata,
+        }
+
+def conditional_headers(entry):
+    headers = {}
+    if entry["etag"]:
+        headers["If-None-Match"] = entry["etag"]
+    if entry["last_modified"]:
+        headers["If-Modified-Since"] = entry["last_modified"]
+    return headers
+
+def reuse_cached_download(entry, folder, file_type):
+    metadata = dict(entry["metadata"])
+    file_path = os.path.join(os.path.normpath(folder), metadata["name"])
+    if os.path.normpath(entry["file_path"]) != file_path:
+        # Same asset linked from another page: copy locally rather than refetch.
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        with open(entry["file_path"], "rb") as src, atomic_write(file_path) as f:
+            shutil.copyfileobj(src, f)
+        metadata["file_path"] = file_path.replace(os.sep, "/")
+    logger.info(f"♻️ Unchanged {file_type}, reused cached copy → {metadata['file_path']}")
+    return metadata
+
+# ---------------- File Downloader ---------------- #
+@contextmanager
+def atomic_write(file_path):
+    # Different URLs can map to the same filename (query strings are dropped)
+    # and are downloaded concurrently, so each writer fills its own temp file
+    # and swaps it into place; readers only ever see a complete file.
+    tmp_path = f"{file_path}.{uuid.uuid4().hex}.part"
+    try:
+        with open(tmp_path, "xb") as f:
+            yield f
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+@lru_cache(maxsize=256)
+def guess_extension(content_type):
+    return mimetypes.guess_extension(content_type.split(";")[0].strip()) or ""
+
+ALLOWED_CONTENT_TYPES = (
+    "application/pdf",
+    "image/",
+    "text/csv",
+    "application/csv",
+    "text/html",
+    "video/",
+)
+
+def head_content_type(url):
+    # Cheap pre-check so disallowed files are skipped without pulling the body.
+    # Returns "" when the server rejects HEAD (e.g. 405) or omits the header,
+    # in which case the caller falls back to checking the GET response. Sent
+    # once, without status retries: the GET fallback already retries.
+    try:
+        head = CLIENT.head(url, timeout=30)
+    except httpx.HTTPError:
+        return ""
+    if not head.is_success:
+        return ""
+    return head.headers.get("Content-Type", "").lower()
+
+def download_file(url, folder, file_type, use_this_name=None, file_date=None, version=None, description=None):
+    if not url.startswith("http"):
+        return None
+    response = None
+    try:
+        cached = get_cached_download(url)
+        if cached:
+            # Type was validated when the file was first downloaded.
+            response = request_with_retries("GET", url, stream=True, headers=conditional_headers(cached))
+            if response.status_code == 304:
+                return reuse_cached_download(cached, folder, file_type)
+        else:
+            content_type = head_content_type(url)
+            if content_type and not content_type.startswith(ALLOWED_CONTENT_TYPES):
+                logger.warning(f"⚠️ Skipped {file_type} (invalid type: {content_type}) → {url}")
+                return None
+
+            response = request_with_retries("GET", url, stream=True)
         response.raise_for_status()
 
         content_type = response.headers.get("Content-Type", "").lower()
-        allowed_types = (
-            content_type.startswith("application/pdf")
-            or content_type.startswith("image/")
-            or content_type.startswith("text/csv")
-            or content_type.startswith("application/csv")
-            or content_type.startswith("text/html")
-            or content_type.startswith("video/")
-        )
-        if not allowed_types:
+        if not content_type.startswith(ALLOWED_CONTENT_TYPES):
             logger.warning(f"⚠️ Skipped {file_type} (invalid type: {content_type}) → {url}")
             return None
 
@@ -75,26 +266,25 @@ def download_file(url, folder, file_type, use_this_name=None, file_date=None, ve
         ext = os.path.splitext(filename)[1].lower()
         if ext == ".ashx":
             if content_type.startswith("image/"):
-                ext = mimetypes.guess_extension(content_type.split(";")[0].strip()) or ".jpg"
+                ext = guess_extension(content_type) or ".jpg"
             else:
                 ext = ".jpg"
             filename = os.path.splitext(filename)[0] + ext
         if not ext:
-            ext = mimetypes.guess_extension(content_type.split(";")[0].strip()) or ""
+            ext = guess_extension(content_type)
             filename = filename + ext
 
         os.makedirs(folder, exist_ok=True)
         file_path = os.path.join(folder, filename)
 
-        with open(file_path, "wb") as f:
-            for chunk in response.iter_content(chunk_size=1024 * 1024):
-                if chunk:
-                    f.write(chunk)
+        with atomic_write(file_path) as f:
+            for chunk in response.iter_bytes(chunk_size=1024 * 1024):
+                f.write(chunk)
 
         file_path_json = file_path.replace(os.sep, "/")
         logger.info(f"📥 Downloaded {file_type} → {file_path_json}")
 
-        return {
+        metadata = {
             "name": filename,
             "file_path": file_path_json,
             "version": version or None,
@@ -103,21 +293,53 @@ def download_file(url, folder, file_type, use_this_name=None, file_date=None, ve
             "language": "english",
             "description": description or None,
         }
+        remember_download(url, response, metadata)
+        return metadata
 
-    except requests.exceptions.Timeout:
+    except httpx.TimeoutException:
         logger.error(f"⏱️ Timeout while downloading {file_type} → {url}")
-    except requests.exceptions.HTTPError as e:
+    except httpx.HTTPStatusError as e:
         logger.error(f"❌ HTTP {e.response.status_code} while downloading {file_type} → {url}")
     except Exception as e:
         logger.error(f"💥 Unexpected error while downloading {file_type} → {url}: {e}")
+    finally:
+        if response is not None:
+            response.close()
     return None
 
+def download_all(downloads):
+    """
+    Downloads (url, folder, file_type) items concurrently over the shared client.
+    Returns the metadata (or None) for each item, in input order.
+    """
+    if not downloads:
+        return []
+    workers = min(DOWNLOAD_CONCURRENCY, len(downloads))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(lambda item: download_file(*item), downloads))
+
+# ---------------- Markdown Conversion ---------------- #
+# markdownify is pure-Python and CPU-bound, so fragments are converted in a
+# process pool shared by all pages (and crawl threads) of this process. Spawn
+# avoids forking a process that already runs browser and download threads.
+_markdown_pool = None
+_markdown_pool_lock = threading.Lock()
+
+def to_markdown(html_fragments):
+    global _markdown_pool
+    if not html_fragments:
+        return []
+    with _markdown_pool_lock:
+        if _markdown_pool is None:
+            _markdown_pool = ProcessPoolExecutor(mp_context=multiprocessing.get_context("spawn"))
+    return list(_markdown_pool.map(md, html_fragments, chunksize=8))
+
 # ---------------- Save Metadata ---------------- #
 def save_metadata(folder, metadata_list, filename="metadata.json"):
     try:
         metadata_path = os.path.join(folder, filename)
-        with open(metadata_path, "w", encoding="utf-8") as f:
-            json.dump(metadata_list, f, indent=4)
+        with open(metadata_path, "wb") as f:
+            f.write(orjson.dumps(metadata_list, option=orjson.OPT_INDENT_2))
         logger.info(f"🗂️ Saved metadata → {metadata_path}")
     except Exception as e:
         logger.error(f"💥 Failed to save metadata {filename}: {e}")
@@ -128,37 +350,64 @@ def detect_url_level(url: str) -> str:
         return "category"
     return "product"
 
+# ---------------- Browser ---------------- #
+# Callers keep the CDP connection for the life of their sync_playwright()
+# block and open/close contexts on it; the browser itself is never closed.
+def connect_browser(p):
+    logger.info("🚀 Connecting to remote Chrome over CDP...")
+    return p.chromium.connect_over_cdp(BROWSERLESS_CDP_URL)
+
+PROXY = {
+    "server": f"http://{OXY_HOST}",
+    "username": OXY_USER,
+    "password": OXY_PASS,
+}
+# Device descriptor + proxy, expanded once and reused for every context.
+_context_kwargs = None
+
+def new_browser_context(p, browser):
+    global _context_kwargs
+    if _context_kwargs is None:
+        _context_kwargs = {**p.devices["Desktop Chrome"], "proxy": PROXY}
+    return browser.new_context(**_context_kwargs)
+
+# ---------------- Wait For Content ---------------- #
+# Selectors whose presence means the page has rendered what we extract.
+READY_SELECTORS = {
+    "product": ", ".join(config["overview_text_xpath"] + config["specifications_xpath"]),
+    "category": "section h2",
+}
+
+def wait_for_content(page, url, level):
+    # Returns as soon as the content is attached instead of sleeping a fixed
+    # 10s. Pages without the expected blocks get a short network-idle window,
+    # so the worst case (8s + 2s) stays at the old fixed delay.
+    try:
+        page.wait_for_selector(READY_SELECTORS[level], state="attached", timeout=8000)
+    except PlaywrightTimeoutError:
+        logger.warning(f"⏳ Content selectors not found after 8s, reading page anyway → {url}")
+        try:
+            page.wait_for_load_state("networkidle", timeout=2000)
+        except PlaywrightTimeoutError:
+            pass
+
 # ---------------- Crawl Product Page ---------------- #
-def crawl_product_page(url, output_folder, products_data_dict, level):
+def crawl_product_page(url, output_folder, products_data_dict, level, context):
     if not url:
         return
-    browser = None
+    # A page that can't be loaded (e.g. the browser session dropped) raises to
+    # the caller instead of leaving empty output files behind.
+    logger.info(f"🌐 Crawling {level} page → {url}")
+    page = context.new_page()
     try:
-        logger.info(f"🌐 Crawling {level} page → {url}")
-        with sync_playwright() as p:
-            try:
-                logger.info("🚀 Launching remote Firefox browser...")
-                browser = p.chromium.connect(
-                    f"wss://production-sfo.browserless.io/chrome/playwright?token={TOKEN}"
-                )
-                device = p.devices["Desktop Chrome"]
-                context = browser.new_context(
-                    **device,
-                    proxy={
-                        "server": f"http://{OXY_HOST}",
-                        "username": OXY_USER,
-                        "password": OXY_PASS,
-                    }
-                )
-                page = context.new_page()
-                page.goto(url, wait_until="domcontentloaded", timeout=60000)
-                page.wait_for_timeout(10000)
-                html_content = page.content()
-            finally:
-                if browser:
-                    browser.close()
+        page.goto(url, wait_until="domcontentloaded", timeout=60000)
+        wait_for_content(page, url, level)
+        html_content = page.content()
+    finally:
+        page.close()
 
-        soup = BeautifulSoup(html_content, "lxml")
+    try:
+        root = lxml.html.fromstring(html_content)
 
         folder_structure = {
             "documentations": [],
@@ -174,16 +423,13 @@ def crawl_product_page(url, output_folder, products_data_dict, level):
             for folder in folder_structure.keys():
                 os.makedirs(os.path.join(output_folder, folder), exist_ok=True)
 
-        overview_text = ""
-        for selector_ in config["overview_text_xpath"]:
-            for p in soup.select(selector_):
-                overview_text += md(str(p)) + "\n\n"
+        overview_parts = to_markdown([outer_html(p) for p in OVERVIEW_SELECTOR(root)])
         if level == "category":
-            p_items = soup.select("section h2")
+            p_items = CATEGORY_HEADING_SELECTOR(root)
             if p_items:
-                overview_text += md("## main category :") + "\n\n"
-            for p in p_items:
-                overview_text += md(str(p)) + "\n\n"
+                overview_parts.append(md("## main category :"))
+            overview_parts.extend(to_markdown([outer_html(p) for p in p_items]))
+        overview_text = "".join(part + "\n\n" for part in overview_parts)
 
         if overview_text:
             markdown_path = (
@@ -199,11 +445,8 @@ def crawl_product_page(url, output_folder, products_data_dict, level):
             return
 
         # product_details = {}
-        specifications = ""
-        for _selector_ in config["specifications_xpath"]:
-            specs_items = soup.select_one(_selector_)
-            if specs_items:
-                specifications += specs_items.get_text(strip=True)
+        specs_items = SPECIFICATIONS_SELECTOR(root)
+        specifications = stripped_text(specs_items[0]) if specs_items else ""
         # product_details["specifications"] = specifications
 
         # if product_details:
@@ -212,49 +455,48 @@ def crawl_product_page(url, output_folder, products_data_dict, level):
         #         json.dump(product_details, f, indent=4)
         #     logger.info(f"📑 Saved product details → {details_path}")
 
-        doc_metadata = []
-        datasheet_link = None
-        product_summary_link = soup.select_one(config["product_datasheet_selector"])
-        if product_summary_link:
-            file_url = urljoin(url, product_summary_link.get("href"))
-            if file_url:
-                datasheet_link = file_url
-                metadata = download_file(file_url, os.path.join(output_folder, "documentations"), "documentation")
-                if metadata:
-                    doc_metadata.append(metadata)
-
-        for selector in config["documentation_xpaths"]:
-            for link in soup.select(selector):
-                file_url = urljoin(url, link.get("href"))
-                if file_url and file_url != datasheet_link:
-                    metadata = download_file(file_url, os.path.join(output_folder, "documentations"), "documentation")
-                    if metadata:
-                        doc_metadata.append(metadata)
-        save_metadata(os.path.join(output_folder, "documentations"), doc_metadata)
-
-        image_metadata = []
-        product_images = soup.select(config["image_xpaths"][0])
+        documentations_folder = os.path.join(output_folder, "documentations")
+        images_folder = os.path.join(output_folder, "images")
+        block_diagrams_folder = os.path.join(output_folder, "block_diagrams")
+
+        # Selectors overlap (the datasheet link is also a documentation link, and
+        # pages repeat links), so each URL is fetched once per target folder.
+        downloads = []
+        seen = set()
+
+        def queue_download(file_url, folder, file_type):
+            if not file_url or (file_url, folder) in seen:
+                return
+            seen.add((file_url, folder))
+            downloads.append((file_url, folder, file_type))
+
+        product_summary_links = DATASHEET_SELECTOR(root)
+        if product_summary_links:
+            file_url = urljoin(url, product_summary_links[0].get("href"))
+            queue_download(file_url, documentations_folder, "documentation")
+
+        for link in DOCUMENTATION_SELECTOR(root):
+            file_url = urljoin(url, link.get("href"))
+            queue_download(file_url, documentations_folder, "documentation")
+
+        product_images = IMAGE_SELECTOR(root)
         for img in product_images:
             img_url = urljoin(url, img.get("src"))
-            if img_url:
-                metadata = download_file(img_url, os.path.join(output_folder, "images"), "product image")
-                if metadata:
-                    image_metadata.append(metadata)
-        save_metadata(os.path.join(output_folder, "images"), image_metadata)
-
-        block_metadata = []
-        for selector in config["block_diagram_xpath"]:
-            for img in soup.select(selector):
-                img_url = urljoin(url, img.get("src"))
-                if img_url:
-                    metadata = download_file(img_url, os.path.join(output_folder, "block_diagrams"), "block diagram")
-                    if metadata:
-                        block_metadata.append(metadata)
-        save_metadata(
-            os.path.join(output_folder, "block_diagrams"),
-            block_metadata,
-            filename="bloack_diagram_mappings.json"
-        )
+            queue_download(img_url, images_folder, "product image")
+
+        for img in BLOCK_DIAGRAM_SELECTOR(root):
+            img_url = urljoin(url, img.get("src"))
+            queue_download(img_url, block_diagrams_folder, "block diagram")
+
+        metadata_files = {
+            documentations_folder: "metadata.json",
+            images_folder: "metadata.json",
+            block_diagrams_folder: "bloack_diagram_mappings.json",
+        }
+        metadata_by_folder = {folder: [] for folder in metadata_files}
+        for (_, folder, _), metadata in zip(downloads, download_all(downloads)):
+            if metadata:
+                metadata_by_folder[folder].append(metadata)
 
         product_name = os.path.basename(urlparse(url).path)
         products_data_dict[product_name] = {
@@ -263,35 +505,50 @@ def crawl_product_page(url, output_folder, products_data_dict, level):
             "summary": overview_text,
         }
 
+        # Metadata is accumulated during the crawl and written once per file here.
+        for folder, filename in metadata_files.items():
+            save_metadata(folder, metadata_by_folder[folder], filename=filename)
+
     except Exception as e:
         logger.error(f"💥 Error crawling product page {url}: {e}")
 
-# ---------------- Main ---------------- #
-def main():
-    parser = argparse.ArgumentParser()
-    parser.add_argument("--url", required=True, help="🔗 URL of the topic/product page.")
-    parser.add_argument("--out", required=True, help="📁 Output directory for the crawled data.")
-    args = parser.parse_args()
-
-    output_dir_base = args.out
-    product_url = args.url
+# ---------------- Crawl Topic ---------------- #
+def crawl_topic(product_url, output_dir_base, context):
     level = detect_url_level(product_url)
     os.makedirs(output_dir_base, exist_ok=True)
 
     products_data = {}
-    crawl_product_page(product_url, output_dir_base, products_data, level)
+    crawl_product_page(product_url, output_dir_base, products_data, level, context)
 
     if level == "product":
         tables_folder = os.path.join(output_dir_base, "tables")
         os.makedirs(tables_folder, exist_ok=True)
         save_metadata(tables_folder, [], filename="metadata.json")
         try:
-            with open(os.path.join(tables_folder, "products.json"), "w", encoding="utf-8") as f:
-                json.dump(products_data, f, indent=4)
+            with open(os.path.join(tables_folder, "products.json"), "wb") as f:
+                f.write(orjson.dumps(products_data, option=orjson.OPT_INDENT_2))
             logger.info(f"📦 Saved products data → {tables_folder}/products.json")
         except Exception as e:
             logger.error(f"💥 Failed to save products.json: {e}")
 
+# ---------------- Main ---------------- #
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--url", required=True, help="🔗 URL of the topic/product page.")
+    parser.add_argument("--out", required=True, help="📁 Output directory for the crawled data.")
+    args = parser.parse_args()
+
+    load_downloads_cache(os.path.join(args.out, DOWNLOADS_CACHE_FILENAME))
+    try:
+        with sync_playwright() as p:
+            context = new_browser_context(p, connect_browser(p))
+            try:
+                crawl_topic(args.url, args.out, context)
+            finally:
+                context.close()
+    finally:
+        save_downloads_cache()
+
     logger.info("🎉 Crawl finished successfully!")
 
 if __name__ == "__main__":
@@ -4,7 +4,8 @@ import argparse
 import logging
 from urllib.parse import urljoin
 from playwright.sync_api import sync_playwright
-from bs4 import BeautifulSoup
+import lxml.html
+from lxml.cssselect import CSSSelector
 
 # ---------------- Logging Setup ---------------- #
 logging.basicConfig(level=logging.INFO,
@@ -16,16 +17,27 @@ TOKEN = os.environ.get("BROWSERLESS_TOKEN")
 OXY_USER = os.getenv("OXYLAB_ISP_USERNAME")
 OXY_PASS = os.getenv("OXYLAB_ISP_PASSWORD")
 OXY_HOST = "isp.oxylabs.io:8007"
+BROWSERLESS_CDP_URL = os.getenv(
+    "BROWSERLESS_CDP_URL", f"wss://production-sfo.browserless.io?token={TOKEN}"
+)
 
 config = {
     "topic_container_selector": "div.o-container section",
     "product_urls_xpath": "a.c-card--link",
 }
 
+# Selectors compiled once to lxml XPath expressions.
+TOPIC_CONTAINER_SELECTOR = CSSSelector(config["topic_container_selector"], translator="html")
+PRODUCT_URLS_SELECTOR = CSSSelector(config["product_urls_xpath"], translator="html")
+PRODUCT_NAME_SELECTORS = (
+    CSSSelector("span.c-product-card__heading", translator="html"),
+    CSSSelector("h2.c-type-display-large", translator="html"),
+)
+
 # ---------------- Extract Related Products ---------------- #
-def extract_related_products(topic_url, topic_name, soup_topic):
+def extract_related_products(topic_url, topic_name, topic_element):
     try:
-        products_elements = soup_topic.select(config["product_urls_xpath"])
+        products_elements = PRODUCT_URLS_SELECTOR(topic_element)
         all_topics = []
 
         for product_element in products_elements:
@@ -33,14 +45,17 @@ def extract_related_products(topic_url, topic_name, soup_topic):
             if not product_url:
                 continue
 
-            product_name = product_element.find("span", class_="c-product-card__heading")
-            if not product_name:
-                product_name = product_element.find("h2", class_="c-type-display-large")
-            if not product_name:
+            product_name = None
+            for selector in PRODUCT_NAME_SELECTORS:
+                matches = selector(product_element)
+                if matches:
+                    product_name = matches[0]
+                    break
+            if product_name is None:
                 logger.warning("⚠️ Skipped product (no name found).")
                 continue
 
-            product_name = product_name.text.strip()
+            product_name = product_name.text_content().strip()
             absolute_url = urljoin(topic_url, product_url)
 
             topic = {
@@ -70,12 +85,10 @@ def get_topic_structure(url):
     topics_html = ""
 
     with sync_playwright() as p:
-        browser = None
+        context = None
         try:
-            logger.info("🚀 Launching remote Chrome browser...")
-            browser = p.chromium.connect(
-                f"wss://production-sfo.browserless.io/chrome/playwright?token={TOKEN}"
-            )
+            logger.info("🚀 Connecting to remote Chrome over CDP...")
+            browser = p.chromium.connect_over_cdp(BROWSERLESS_CDP_URL)
             device = p.devices["Desktop Chrome"]
             context = browser.new_context(
                 **device,
@@ -100,21 +113,21 @@ def get_topic_structure(url):
         except Exception as e:
             logger.error(f"❌ Error loading page: {e}")
         finally:
-            if browser:
-                browser.close()
-                logger.info("🛑 Browser session closed.")
+            if context:
+                context.close()
+                logger.info("🛑 Browser context closed.")
 
     if not topics_html:
         logger.warning("⚠️ No HTML content retrieved, returning empty structure.")
         return topic_structure
 
     try:
-        soup = BeautifulSoup(topics_html, "lxml")
-        main_topics = soup.select(config["topic_container_selector"])
+        root = lxml.html.fromstring(topics_html)
+        main_topics = TOPIC_CONTAINER_SELECTOR(root)
 
         for topic in main_topics:
-            topic_elem = topic.find("h2")
-            topic_name = topic_elem.text.strip() if topic_elem else ""
+            topic_elem = topic.find(".//h2")
+            topic_name = topic_elem.text_content().strip() if topic_elem is not None else ""
 
             main_topic = {
                 "name": topic_name if topic_name else "top products",